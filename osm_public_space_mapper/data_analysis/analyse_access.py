@@ -1,9 +1,10 @@
 from typing import List, Set
 
+import numpy as np
 import shapely
 from shapely.geometry import MultiPolygon, Polygon
 
-from osm_public_space_mapper.utils.helpers import buffer_list_of_elements
+from osm_public_space_mapper.utils.helpers import buffer_geometries_of_elements
 from osm_public_space_mapper.utils.osm_element import OsmElement
 
 
@@ -219,9 +220,9 @@ def get_inaccessible_enclosed_areas(inaccessible_barriers: List[OsmElement], bui
     """
 
     buffer_size = 0.001
-    barriers_buffered = buffer_list_of_elements(inaccessible_barriers, buffer_size, cap_style='square')
-    buildings_buffered = buffer_list_of_elements(buildings, buffer_size, cap_style='square')
-    barriers_buildings_union = shapely.ops.unary_union([e.geom for e in (barriers_buffered + buildings_buffered)])
+    barriers_buffered = buffer_geometries_of_elements(inaccessible_barriers, buffer_size, cap_style='square')
+    buildings_buffered = buffer_geometries_of_elements(buildings, buffer_size, cap_style='square')
+    barriers_buildings_union = shapely.ops.unary_union(np.concatenate([barriers_buffered, buildings_buffered]))
     inaccessible_enclosed_areas = list()
     for polygon in barriers_buildings_union.geoms:
         if len(polygon.interiors) > 0:
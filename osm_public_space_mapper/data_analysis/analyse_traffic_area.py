@@ -1,27 +1,70 @@
-import copy
-from typing import Dict, List, Set, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Tuple
 
+import numpy as np
 import shapely
 from shapely.geometry import MultiPolygon, Polygon
 
 from example_application import local_variables as local_var
-from osm_public_space_mapper.utils.helpers import buffer_list_of_elements
+from osm_public_space_mapper.utils.helpers import buffer_geometries_of_elements
 from osm_public_space_mapper.utils.osm_element import OsmElement
 
+_HIGHWAY_DEFAULT_WIDTHS = MappingProxyType({
+    'footway': (1.8, 1),
+    'service': (4.5, 3),
+    'residential': (4.5, 3),
+    'steps': (2, 1.5),
+    'tertiary': (4.8, 3.1),
+    'primary': (5.5, 3.1),
+    'cycleway': (2, 1.5),
+    'secondary': (4.8, 3.1),
+    'path': (1.5, 1),
+    'motorway_link': (6.5, 3.23),
+    'platform': (2, 1.5),
+    'pedestrian': (2, 2),
+    'motorway': (6.5, 3.25),
+    'living_street': (4.5, 3),
+    'unclassified': (4.5, 3),
+    'primary_link': (5.5, 3.1),
+    'track': (3, 2.5),
+    'corridor': (2, 1),
+    'proposed': (4.8, 3.1),
+    'secondary_link': (4.8, 3.1),
+    'construction': (5.5, 3.1),
+    'everything else': (4.8, 3.1)
+})
+_CYCLETRACK_WIDTH, _CYCLELANE_WIDTH = 1.6, 1.6
+_CYCLEWAY_DEFAULT_WIDTHS = MappingProxyType({
+    'cycleway': MappingProxyType({
+        'lane': _CYCLELANE_WIDTH,
+        'opposite': 1,
+        'track': _CYCLETRACK_WIDTH,
+        'opposite_lane': _CYCLELANE_WIDTH,
+        'opposite_track': _CYCLETRACK_WIDTH
+    }),
+    'cycleway:right': MappingProxyType({
+        'lane': _CYCLELANE_WIDTH,
+        'track': _CYCLETRACK_WIDTH
+    }),
+    'cycleway:both': MappingProxyType({
+        'lane': 2 * _CYCLELANE_WIDTH,
+        'track': 2 * _CYCLETRACK_WIDTH
+    }),
+    'cycleway:left': MappingProxyType({
+        'lane': _CYCLELANE_WIDTH,
+        'track': _CYCLETRACK_WIDTH
+    })
+})
+
+_HIGHWAY_FOR_PEDESTRIANS = frozenset(('footway', 'steps', 'path', 'platform', 'pedestrian', 'living_street', 'track'))
+
 
 def is_crossing(element):
-    tags_with_crossing_values = set(('footway', 'highway'))
-    if element.has_tag('crossing'):
-        return True
-    for tag in tags_with_crossing_values:
-        if element.tags.get(tag) == 'crossing':
-            return True
-    return False
+    return element.tags.get('crossing') is not None or 'crossing' in (element.tags.get('footway'), element.tags.get('highway'))
 
 
 def is_pedestrian_way(element):
-    highway_for_pedestrians = ['footway', 'steps', 'path', 'platform', 'pedestrian', 'living_street', 'track']
-    return element.tags.get('highway') in highway_for_pedestrians and not element.tags.get('footway') == 'crossing'
+    return element.tags.get('highway') in _HIGHWAY_FOR_PEDESTRIANS and not element.tags.get('footway') == 'crossing'
 
 
 def get_traffic_areas_as_polygons(
@@ -35,174 +78,161 @@ def get_traffic_areas_as_polygons(
     pedestrian_way_default_width: float = 1.6,
     non_traffic_space_around_buildings_default_width: float = 1.3
 ) -> List[Polygon, MultiPolygon]:
-    def buffer_osm_element(element: OsmElement) -> OsmElement:
-        buffer_size = round(element.width / 2, 1)
-        element_buffered = copy.deepcopy(element)
-        element_buffered.geom = element.geom.buffer(buffer_size, cap_style='flat')
-        return element_buffered
+    if highway_default_widths is None:
+        highway_default_widths = _HIGHWAY_DEFAULT_WIDTHS
+    if cycleway_default_widths is None:
+        cycleway_default_widths = _CYCLEWAY_DEFAULT_WIDTHS
+
+    def buffer_osm_elements(elements: List[OsmElement]) -> List[OsmElement]:
+        buffer_sizes = [round(e.width / 2, 1) for e in elements]
+        geometries_buffered = shapely.buffer([e.geom for e in elements], buffer_sizes, quad_segs=16, cap_style='flat')
+        return [e.clone_with_geom(geometry_buffered) for e, geometry_buffered in zip(elements, geometries_buffered)]
 
-    def polygonize_highways(elements: List[OsmElement], highway_default_widths: Dict[str, Tuple[float, float]], cycleway_default_widths: Dict[Dict[str, float]]) -> List[OsmElement]:
-        """iterates over list of OsmElements and buffers highways and thus transforms the LineStrings to Polygons based on given or estimated width and sets processed elements in given list to ignore
+    def sort_elements(elements: List[OsmElement]) -> Tuple[List[OsmElement], List[OsmElement], List[OsmElement], List[OsmElement]]:
+        """iterates once over list of OsmElements and sorts out the elements relevant for the traffic areas
 
         Args:
             elements (list[OsmElement]): list of OsmElements to iterate over
 
+        Returns:
+            tuple[list[OsmElement], list[OsmElement], list[OsmElement], list[OsmElement]]: pedestrian ways, all other highways, railway LineStrings and platforms
+        """
+        pedestrian_ways, other_highways, railways, platforms = [], [], [], []
+        for e in elements:
+            if e.tags.get('highway') is not None:
+                if is_pedestrian_way(e):
+                    pedestrian_ways.append(e)
+                else:
+                    other_highways.append(e)
+            railway = e.tags.get('railway')
+            if railway == 'platform':
+                platforms.append(e)
+            if railway is not None and e.is_linestring():
+                railways.append(e)
+        return pedestrian_ways, other_highways, railways, platforms
+
+    def polygonize_highways(pedestrian_ways: List[OsmElement], other_highways: List[OsmElement], highway_default_widths: Dict[str, Tuple[float, float]], cycleway_default_widths: Dict[Dict[str, float]]) -> List[OsmElement]:
+        """iterates over lists of highways and buffers them and thus transforms the LineStrings to Polygons based on given or estimated width and sets processed elements in given list to ignore
+
+        Args:
+            pedestrian_ways (list[OsmElement]): list of OsmElements with highway tag that are pedestrian ways, these are marked as walking area but not buffered
+            other_highways (list[OsmElement]): list of all other OsmElements with highway tag to iterate over
+
         Returns:
             list[OsmElement]: list of only highways as OsmElements with buffered geom attribute
         """
-        def set_road_width(element: OsmElement, highway_default_widths: Dict[str, Tuple[float, float]], cycleway_default_widths: Dict[Dict[str, float]]) -> None:
+        def set_default_highway_width(highway: str, direction: str, highway_default_widths: Dict[str, Tuple[float, float]]) -> float:
+            i = 1 if direction == 'uni-directional' else 0 if direction == 'bi-directional' else None
+            if highway in highway_default_widths:
+                width = highway_default_widths[highway][i]
+            else:
+                width = highway_default_widths['everything else'][i]
+            return width
+
+        def adapt_to_lanes(element: OsmElement, width: float, direction: str) -> float:
+            normal_lane_number = 1 if direction == 'uni-directional' else 2 if direction == 'bi-directional' else None
+            lanes = element.tags.get('lanes')
+            if lanes is not None and float(lanes) != normal_lane_number:
+                width = width * float(lanes) / normal_lane_number
+            return width
+
+        def add_cycleway(element: OsmElement, highway: str, width: float, cycleway_default_widths: Dict[Dict[str, float]]) -> float:
+            if highway not in cycleway_default_widths:  # if it's not a cycleway by itself
+                for tag, cycleway_widths in cycleway_default_widths.items():
+                    value = element.tags.get(tag)
+                    if value is not None and value in cycleway_widths:
+                        width += cycleway_widths[value]
+            return width
+
+        def add_parking(highway: str,
+                        width: float,
+                        highway_types_for_default_streetside_parking: List[str] = ['residential', 'tertiary', 'living_street', 'secondary', 'primary'],
+                        default_parking_width: float = 6.5) -> float:
+            """adds a default value to the given width if highway is of specific type
+
+            Args:
+                highway (str): highway tag value of the element
+                width (float): current width of the element
+                highway_types_for_default_streetside_parking (list[str], optional): highway tag values where parking is assumed. Defaults to ['residential', 'tertiary', 'living_street', 'secondary', 'primary'].
+                default_parking_width (float, optional): _description_. Defaults to 6.5, assuming one side horizontal (2m) and one side angle parking (4.5m),
+                taken from OSM Verkehrswende project https://parkraum.osm-verkehrswende.org/project-prototype-neukoelln/report/#27-fl%C3%A4chenverbrauch
+
+            Returns:
+                float: width with added parking
+            """
+            if highway in highway_types_for_default_streetside_parking:
+                width += default_parking_width
+            return width
+
+        def estimate_road_width(element: OsmElement, highway: str, highway_default_widths: Dict[str, Tuple[float, float]], cycleway_default_widths: Dict[Dict[str, float]]) -> float:
+            """estimates road with of an OsmElement based on default values and tags and returns the width
+
+            Args:
+                element (OsmElement): the OsmElement to analyse
+                highway (str): highway tag value of the element
+                highway_default_widths (dict[str, Tuple[float, float]]): dictionary with default highway widths of the roadway without parking, cycle lane etc. in a dictionary for each OSM highway type.
+                                                                        Each dict element has a tuple consisting of the value for bi-directional and uni-directional highways.
+                cycleway_default_widths (dict[Dict[str, float]]): default cycleway widths with separate values given for different tags and their values in a nested dictionary
+
+            Returns:
+                float: estimated width
+            """
+            direction = 'uni-directional' if element.tags.get('oneway') is not None else 'bi-directional'
+            width = set_default_highway_width(highway, direction, highway_default_widths)
+            width = adapt_to_lanes(element, width, direction)
+            width = add_cycleway(element, highway, width, cycleway_default_widths)
+            width = add_parking(highway, width, local_var.highway_types_for_default_streetside_parking, local_var.default_parking_width)
+            return width
+
+        def set_road_width(element: OsmElement, highway: str, highway_default_widths: Dict[str, Tuple[float, float]], cycleway_default_widths: Dict[Dict[str, float]]) -> None:
             """Sets road width of a highway element in width attribute, either taken from width tags or estimated based on default values and
 
             Args:
                 element (OsmElement): the OsmElement to analyse
+                highway (str): highway tag value of the element
                 highway_default_widths (dict[str, Tuple[float, float]]): dictionary with default highway widths of the roadway without parking, cycle lane etc. in a dictionary for each OSM highway type.
-                                                                        Each dict element has a tuple consisting of the value for bi-directional and uni-directional highways. Defaults set within function.
-                cycleway_default_widths (dict[Dict[str, float]]): default cycleway widths with separate values given for different tags and their values in a nested dictionary. Defaults set within function.
+                                                                        Each dict element has a tuple consisting of the value for bi-directional and uni-directional highways.
+                cycleway_default_widths (dict[Dict[str, float]]): default cycleway widths with separate values given for different tags and their values in a nested dictionary.
             """
-            def set_defaults(highway_default_widths: Dict[str, Tuple[float, float]], cycleway_default_widths: Dict[Dict[str, float]]) -> Set[Dict, Dict]:
-                if highway_default_widths is None:
-                    highway_default_widths = {
-                        'footway': (1.8, 1),
-                        'service': (4.5, 3),
-                        'residential': (4.5, 3),
-                        'steps': (2, 1.5),
-                        'tertiary': (4.8, 3.1),
-                        'primary': (5.5, 3.1),
-                        'cycleway': (2, 1.5),
-                        'secondary': (4.8, 3.1),
-                        'path': (1.5, 1),
-                        'motorway_link': (6.5, 3.23),
-                        'platform': (2, 1.5),
-                        'pedestrian': (2, 2),
-                        'motorway': (6.5, 3.25),
-                        'living_street': (4.5, 3),
-                        'unclassified': (4.5, 3),
-                        'primary_link': (5.5, 3.1),
-                        'track': (3, 2.5),
-                        'corridor': (2, 1),
-                        'proposed': (4.8, 3.1),
-                        'secondary_link': (4.8, 3.1),
-                        'construction': (5.5, 3.1),
-                        'everything else': (4.8, 3.1)}
-                if cycleway_default_widths is None:
-                    cycletrack_width, cyclelane_width = 1.6, 1.6
-                    cycleway_default_widths = {
-                        'cycleway': {
-                            'lane': cyclelane_width,
-                            'opposite': 1,
-                            'track': cycletrack_width,
-                            'opposite_lane': cyclelane_width,
-                            'opposite_track': cycletrack_width
-                        },
-                        'cycleway:right': {
-                            'lane': cyclelane_width,
-                            'track': cycletrack_width
-                        },
-                        'cycleway:both': {
-                            'lane': 2 * cyclelane_width,
-                            'track': 2 * cycletrack_width
-                        },
-                        'cycleway:left': {
-                            'lane': cyclelane_width,
-                            'track': cycletrack_width
-                        }
-                    }
-                return highway_default_widths, cycleway_default_widths
-
-            highway_default_widths, cycleway_default_widths = set_defaults(highway_default_widths, cycleway_default_widths)
-
-            def estimate_road_width(element: OsmElement, highway_default_widths: Dict[str, Tuple[float, float]], cycleway_default_widths: Dict[Dict[str, float]]) -> float:
-                """estimates road with of an OsmElement based on default values and tags and returns the width
-
-                Args:
-                    element (OsmElement): the OsmElement to analyse
-                    highway_default_widths (dict[str, Tuple[float, float]]): dictionary with default highway widths of the roadway without parking, cycle lane etc. in a dictionary for each OSM highway type.
-                                                                            Each dict element has a tuple consisting of the value for bi-directional and uni-directional highways.
-                    cycleway_default_widths (dict[Dict[str, float]]): default cycleway widths with separate values given for different tags and their values in a nested dictionary
-
-                Returns:
-                    float: estimated width
-                """
-
-                def set_default_highway_width(element: OsmElement, direction: str, highway_default_widths: Dict[str, Tuple[float, float]]) -> float:
-                    i = 1 if direction == 'uni-directional' else 0 if direction == 'bi-directional' else None
-                    if element.tags.get('highway') in highway_default_widths:
-                        width = highway_default_widths[element.tags.get('highway')][i]
-                    else:
-                        width = highway_default_widths['everything else'][i]
-                    return width
-
-                def adapt_to_lanes(element: OsmElement, width: float, direction: str) -> float:
-                    normal_lane_number = 1 if direction == 'uni-directional' else 2 if direction == 'bi-directional' else None
-                    if element.has_tag('lanes') and float(element.tags.get('lanes')) != normal_lane_number:
-                        width = width * float(element.tags.get('lanes')) / normal_lane_number
-                    return width
-
-                def add_cycleway(element: OsmElement, width: float, cycleway_default_widths: Dict[Dict[str, float]]) -> float:
-                    if element.tags.get('highway') not in cycleway_default_widths:  # if it's not a cycleway by itself
-                        for tag in cycleway_default_widths:
-                            if element.has_tag(tag):
-                                if element.tags.get(tag) in cycleway_default_widths[tag]:
-                                    width += cycleway_default_widths[tag][element.tags.get(tag)]
-                    return width
-
-                def add_parking(element: OsmElement,
-                                width: float,
-                                highway_types_for_default_streetside_parking: List[str] = ['residential', 'tertiary', 'living_street', 'secondary', 'primary'],
-                                default_parking_width: float = 6.5) -> float:
-                    """adds a default value to the given width if highway is of specific type
-
-                    Args:
-                        element (OsmElement): highway OsmElement
-                        width (float): current width of the element
-                        highway_types_for_default_streetside_parking (list[str], optional): highway tag values where parking is assumed. Defaults to ['residential', 'tertiary', 'living_street', 'secondary', 'primary'].
-                        default_parking_width (float, optional): _description_. Defaults to 6.5, assuming one side horizontal (2m) and one side angle parking (4.5m),
-                        taken from OSM Verkehrswende project https://parkraum.osm-verkehrswende.org/project-prototype-neukoelln/report/#27-fl%C3%A4chenverbrauch
-
-                    Returns:
-                        float: width with added parking
-                    """
-                    if element.tags.get('highway') in highway_types_for_default_streetside_parking:
-                        width += default_parking_width
-                    return width
-
-                direction = 'uni-directional' if e.has_tag('oneway') else 'bi-directional'
-                width = set_default_highway_width(e, direction, highway_default_widths)
-                width = adapt_to_lanes(e, width, direction)
-                width = add_cycleway(e, width, cycleway_default_widths)
-                width = add_parking(e, width, local_var.highway_types_for_default_streetside_parking, local_var.default_parking_width)
-                return width
-
-            if element.has_tag('width:carriageway'):
-                element.width = float(e.tags.get('width:carriageway'))
-            elif element.has_tag('width'):
-                element.width = float(e.tags.get('width'))
+            width = element.tags.get('width:carriageway')
+            if width is None:
+                width = element.tags.get('width')
+            if width is not None:
+                element.width = float(width)
             else:
-                element.width = estimate_road_width(element, highway_default_widths, cycleway_default_widths)
-
-        def is_irrelevant_highway(element: OsmElement) -> bool:
+                # the estimation only depends on these tag values, which many highway segments share
+                estimation_key = (highway, element.tags.get('oneway') is not None, element.tags.get('lanes')) + tuple(element.tags.get(tag) for tag in cycleway_default_widths)
+                width = estimated_widths.get(estimation_key)
+                if width is None:
+                    width = estimate_road_width(element, highway, highway_default_widths, cycleway_default_widths)
+                    estimated_widths[estimation_key] = width
+                element.width = width
+
+        def is_irrelevant_highway(highway: str) -> bool:
             irrelevant_highway_tag_values = ['corridor', 'proposed']
-            return element.tags.get('highway') in irrelevant_highway_tag_values
-
-        highways_polygons = []
-        for e in [e for e in elements if e.has_tag('highway')]:
-            if is_pedestrian_way(e):
-                if not is_crossing(e):
-                    e.space_type = 'walking area'
-            elif is_irrelevant_highway(e):
+            return highway in irrelevant_highway_tag_values
+
+        estimated_widths = {}
+        highways_to_buffer = []
+        for e in pedestrian_ways:
+            if not is_crossing(e):
+                e.space_type = 'walking area'
+        for e in other_highways:
+            highway = e.tags.get('highway')
+            if is_irrelevant_highway(highway):
                 e.space_type = 'traffic area'
             else:
                 if e.is_linestring():
-                    set_road_width(e, highway_default_widths, cycleway_default_widths)
-                    highways_polygons.append(buffer_osm_element(e))
+                    set_road_width(e, highway, highway_default_widths, cycleway_default_widths)
+                    highways_to_buffer.append(e)
                 e.space_type = 'traffic area'
-        return highways_polygons
+        return buffer_osm_elements(highways_to_buffer)
 
-    def polygonize_railways(elements: List[OsmElement], tram_gauge: float, tram_buffer: float, train_gauge: float, train_buffer: float) -> List[OsmElement]:
-        """iterates over list of OsmElements and buffers railways and thus transforms the LineStrings to Polygons based on tram and train gauge and buffer size
+    def polygonize_railways(railways: List[OsmElement], tram_gauge: float, tram_buffer: float, train_gauge: float, train_buffer: float) -> List[OsmElement]:
+        """iterates over list of railways and buffers them and thus transforms the LineStrings to Polygons based on tram and train gauge and buffer size
 
         Args:
-            elements (list[OsmElement]): list of OsmElements to iterate over
+            railways (list[OsmElement]): list of OsmElements with railway tag and LineString geometry to iterate over
             tram_gauge (float): tram gauge. Defaults to 1.435
             tram_buffer (float): tram buffer size of what should be added to the tram gauge for total tram rail width
             train_gauge (float): train gauge. Defaults to 1.435
@@ -211,64 +241,77 @@ def get_traffic_areas_as_polygons(
         Returns:
             list[OsmElement]: list of only railways as OsmElements with buffered geom attribute
         """
-        rails_polygons = []
-        for e in [e for e in elements if e.is_linestring() and e.has_tag('railway')]:
-            if e.tags.get('railway') == 'tram':
+        rails_to_buffer = []
+        for e in railways:
+            railway = e.tags.get('railway')
+            if railway == 'tram':
                 e.width = tram_gauge + tram_buffer
-            elif e.tags.get('railway') == 'rail':  # ignore subway because assume it's underground
+            elif railway == 'rail':  # ignore subway because assume it's underground
                 e.width = train_gauge + train_buffer
-            if e.tags.get('railway') in ['tram', 'rail']:
-                rails_polygons.append(buffer_osm_element(e))
-            if not e.tags.get('railway') == 'platform':
+            if railway in ['tram', 'rail']:
+                rails_to_buffer.append(e)
+            if not railway == 'platform':
                 e.space_type = 'traffic area'
-        return rails_polygons
+        return buffer_osm_elements(rails_to_buffer)
 
-    def get_traffic_areas(elements: List[OsmElement]) -> List[OsmElement]:
-        return polygonize_highways(elements, highway_default_widths, cycleway_default_widths) + polygonize_railways(elements, tram_gauge, tram_buffer, train_gauge, train_buffer)
+    def get_traffic_areas(pedestrian_ways: List[OsmElement], other_highways: List[OsmElement], railways: List[OsmElement]) -> List[OsmElement]:
+        return polygonize_highways(pedestrian_ways, other_highways, highway_default_widths, cycleway_default_widths) + polygonize_railways(railways, tram_gauge, tram_buffer, train_gauge, train_buffer)
 
-    def get_cropper_geometries(elements: List[OsmElement], inaccessible_enclosed_areas: List[Polygon, MultiPolygon], buildings: List[OsmElement]) -> List[Polygon, MultiPolygon]:
+    def get_cropper_geometries(pedestrian_ways: List[OsmElement], platforms: List[OsmElement], inaccessible_enclosed_areas: List[Polygon, MultiPolygon], buildings: List[OsmElement]) -> np.ndarray:
         """combines and returns all geometries that should be used to crop the traffic areas again
 
         Args:
-            elements (list[OsmElement): list of OsmElements with platform and pedestrian way elements
+            pedestrian_ways (list[OsmElement]): list of OsmElements with pedestrian ways
+            platforms (list[OsmElement]): list of OsmElements with platforms
             inaccessible_enclosed_areas (list[Polygon | MultiPolygon]): list of earlier defined inaccessible_enclosed_areas, because traffic areas will not be accessible there
             buildings (list[OsmElement): list of OsmElements with buildings
 
         Returns:
-            List[Polygon, MultiPolygon]: list of polygon or multipolygon geomtries instead of OsmElements
+            np.ndarray: array of polygon or multipolygon geomtries instead of OsmElements
         """
-        pedestrian_ways_buffered = buffer_list_of_elements([e for e in elements if is_pedestrian_way(e)], buffer_size=pedestrian_way_default_width / 2, cap_style='flat')
-        buildings_buffered = buffer_list_of_elements(buildings, buffer_size=non_traffic_space_around_buildings_default_width, join_style='mitre')
-        platforms = [e for e in elements if e.tags.get('railway') == 'platform']
-        cropper_geometries = [e.geom for e in pedestrian_ways_buffered] + [e.geom for e in buildings_buffered] + [e.geom for e in platforms] + inaccessible_enclosed_areas
+        pedestrian_ways_buffered = buffer_geometries_of_elements(pedestrian_ways, buffer_size=pedestrian_way_default_width / 2, cap_style='flat')
+        buildings_buffered = buffer_geometries_of_elements(buildings, buffer_size=non_traffic_space_around_buildings_default_width, join_style='mitre')
+        cropper_geometries = np.concatenate([pedestrian_ways_buffered, buildings_buffered, [e.geom for e in platforms], inaccessible_enclosed_areas])
         return cropper_geometries
 
-    def crop_traffic_areas(traffic_area_elements: List[OsmElement], cropper_geometries: List[Polygon, MultiPolygon]) -> List[OsmElement]:
-        """Iterates over traffic area elements and crops them when intersecting with a cropper geometry
+    def crop_traffic_areas(traffic_area_elements: List[OsmElement], cropper_geometries: np.ndarray) -> Polygon | MultiPolygon:
+        """Crops every traffic area by the union of the cropper geometries close to it and returns the union of the cropped traffic areas
 
         Args:
             traffic_area_elements (list[OsmElement]): traffic area elements to iterate over
-            cropper_geometries (list[Polygon | MultiPolygon]): cropper geometries
+            cropper_geometries (np.ndarray): cropper geometries
 
         Returns:
-            list[OsmElement]: list of traffic areas as OsmElements with new, cropped geom attribute
+            Polygon | MultiPolygon: union of the cropped traffic areas
+
+        Notes:
+            A spatial index, queried for all traffic areas at once, is used to only union the cropper geometries close to a traffic area instead of all cropper geometries at once.
+            Cropper geometries within 0.6 m are included, so that gaps closed by the 0.3 m buffer are the same as for the union of all cropper geometries.
+            They are clipped to the bounds of the traffic area plus 1 m beforehand, because the buffering only affects the result within 0.6 m of the traffic area
+            and large cropper geometries like buildings would otherwise be buffered as a whole for every traffic area they touch.
         """
+        traffic_area_geometries = np.array([e.geom for e in traffic_area_elements], dtype=object)  # object dtype keeps an empty list queryable
+        cropper_tree = shapely.STRtree(cropper_geometries)
+        traffic_area_indices, cropper_indices = cropper_tree.query(traffic_area_geometries, predicate='dwithin', distance=0.6)  # pairs are ordered by traffic area
+        cropper_indices_per_traffic_area = np.split(cropper_indices, np.searchsorted(traffic_area_indices, np.arange(1, len(traffic_area_geometries))))
         traffic_areas_cropped = []
-        for traffic_area in traffic_area_elements:
-            traffic_area_cropped = copy.deepcopy(traffic_area)
-            for cropper in cropper_geometries:
-                if traffic_area_cropped.geom.intersects(cropper):
-                    traffic_area_cropped.geom = traffic_area_cropped.geom.difference(cropper)
-            traffic_areas_cropped.append(traffic_area_cropped)
-        return traffic_areas_cropped
+        for traffic_area, local_cropper_indices in zip(traffic_area_geometries, cropper_indices_per_traffic_area):
+            if len(local_cropper_indices) == 0:
+                traffic_areas_cropped.append(traffic_area)
+            else:
+                xmin, ymin, xmax, ymax = traffic_area.bounds
+                local_cropper_geometries = shapely.clip_by_rect(cropper_tree.geometries.take(local_cropper_indices), xmin - 1, ymin - 1, xmax + 1, ymax + 1)
+                local_cropper_geometries_union = shapely.ops.unary_union(local_cropper_geometries).buffer(0.3).buffer(-0.3)
+                traffic_areas_cropped.append(traffic_area.difference(local_cropper_geometries_union))
+        return shapely.ops.unary_union(traffic_areas_cropped)
 
     def smooth_traffic_areas(traffic_areas_cropped):
-        smooth_traffic_areas = traffic_areas_cropped.buffer(1, join_style='mitre').buffer(-1, join_style='mitre').buffer(0.5, join_style='round').buffer(-0.5, join_style='round')
+        # 4 segments per quarter circle instead of the default of 16 keep the 0.5 m rounding within 1 cm while creating far fewer vertices
+        smooth_traffic_areas = traffic_areas_cropped.buffer(1, join_style='mitre').buffer(-1, join_style='mitre').buffer(0.5, quad_segs=4, join_style='round').buffer(-0.5, quad_segs=4, join_style='round')
         return smooth_traffic_areas
 
-    traffic_areas = get_traffic_areas(elements)
-    cropper_geometries = get_cropper_geometries(elements, inaccessible_enclosed_areas, buildings)
-    cropper_geometries_union = shapely.ops.unary_union(cropper_geometries).buffer(0.3).buffer(-0.3)
-    traffic_areas_union = shapely.ops.unary_union([e.geom for e in traffic_areas])
-    traffic_areas_cropped = traffic_areas_union.difference(cropper_geometries_union)
+    pedestrian_ways, other_highways, railways, platforms = sort_elements(elements)
+    traffic_areas = get_traffic_areas(pedestrian_ways, other_highways, railways)
+    cropper_geometries = get_cropper_geometries(pedestrian_ways, platforms, inaccessible_enclosed_areas, buildings)
+    traffic_areas_cropped = crop_traffic_areas(traffic_areas, cropper_geometries)
     return smooth_traffic_areas(traffic_areas_cropped)
@@ -1,7 +1,8 @@
 import copy
-from typing import Dict, List, Set, Tuple
+from typing import Callable, Dict, List, Tuple
 
 import esy.osm.shape
+import numpy as np
 import pyproj
 import shapely
 from shapely.geometry import (
@@ -10,47 +11,14 @@ from shapely.geometry import (
 )
 
 from osm_public_space_mapper.utils.bounding_box import BoundingBox
+from osm_public_space_mapper.utils.helpers import (
+    get_projector, transform_geometries
+)
 from osm_public_space_mapper.utils.osm_element import OsmElement
 
 ShapelyGeometry = LinearRing | Polygon | MultiPolygon | Point | MultiPoint | LineString | MultiLineString
 
 
-def drop_invalid_geometries(elements: List[OsmElement]) -> List[OsmElement]:
-    """Returns only the elements of a list of OsmElements that have a valid Shapely geometry
-
-    Args:
-        elements (list[OsmElement]): list of OsmElements
-
-    Returns:
-        list[OsmElement]: filtered list
-
-    Note:
-        OSM relations can not be processed by esy.osm.shape and have an invalid geometry.
-        These elements are excluded from further analysis, because they are not very relevant to the public space analysis.
-    """
-    return [e for e in elements if type(e.geom) != esy.osm.shape.shape.Invalid]
-
-
-def drop_empty_geometries(elements: List[OsmElement]) -> List[OsmElement]:
-    return [e for e in elements if not e.geom.is_empty]
-
-
-def drop_elements_without_tags(elements: List[OsmElement]) -> List[OsmElement]:
-    """Returns only the elements of a list of OsmElements that have a tag
-
-    Args:
-        elements (list[OsmElement]): list of OsmElements
-
-    Returns:
-        list[OsmElement]: filtered list
-
-    Note:
-        OSM elements without tags are usually nodes that are required for the spatial definition of ways in OSM.
-        They are not required for the public space analysis because they do not contain any additional information.
-    """
-    return [e for e in elements if len(e.tags) > 0]
-
-
 def clean_geometries(elements: List[OsmElement]) -> None:
     """Iterates over a list of OsmElements and cleans the geometries by transforming simple multipolygons to polygons,
     transforming false polygons to linestrings and cropping overlapping polygons
@@ -110,120 +78,75 @@ def project_geometries(elements: List[OsmElement], local_crs: pyproj.crs.crs.CRS
         elements (list[OsmElement]): list of OsmElements to iterate over
         local_crs (pyproj.crs.crs.CRS, optional): coordinate reference system to project to
     """
-    projector = pyproj.Transformer.from_crs(pyproj.CRS.from_epsg(4326), local_crs, always_xy=True)
-    for e in elements:
-        e.geom = shapely.ops.transform(projector.transform, e.geom)
+    projector = get_projector(pyproj.CRS.from_epsg(4326), local_crs)
+    geometries_projected = transform_geometries([e.geom for e in elements], projector)
+    for e, geometry_projected in zip(elements, geometries_projected):
+        e.geom = geometry_projected
 
 
 def drop_irrelevant_elements_based_on_tags(elements: List[OsmElement]) -> List[OsmElement]:
-    def drop_elements_non_groundlevel(elements: List[OsmElement]) -> List[OsmElement]:
-        """Iterates over list of OsmElements and drops element not on ground level according to tags
-
-        Args:
-            elements (list): list of OsmElements to iterate over
+    """Iterates once over list of OsmElements and drops the elements that are not on ground level, do not have a relevant tag, have an irrelevant tag or have an irrelevant tag value
 
-        Returns:
-            list[OsmElement]: filtered list
-        """
+    Args:
+        elements (list[OsmElement]): list of OsmElements to iterate over
 
-        def is_non_groundlevel(e: OsmElement) -> bool:
-            if e.has_tag('level'):
-                try:
-                    list(map(float, str(e.tags.get('level')).split(';')))
-                except Exception as e:
-                    print(e)
-                    pass
-                else:
-                    if 0 not in list(map(float, str(e.tags.get('level')).split(';'))):
-                        return True
-            if e.tags.get('tunnel') == 'yes':
+    Returns:
+        list[OsmElement]: filtered list
+    """
+    relevant_tags = ['highway', 'public_transport', 'railway', 'barrier', 'amenity', 'leisure', 'natural',
+                     'parking', 'embankment', 'landuse', 'footway', 'bridge', 'place', 'construction', 'parking_space', 'man_made']
+    irrelevant_tags = ['boundary']
+    relevant_amenity_tag_values = ['fountain', 'shelter', 'parking', 'parking_space', 'bus_station', 'grave_yard', 'biergarten', 'motorcycle_parking', 'public_bath']
+    irrelevant_tag_values = {
+        'highway': frozenset(('street_lamp', 'traffic_signals')),
+        'railway': frozenset(('switch', 'signal')),
+        'natural': frozenset(('tree', 'tree_row')),
+        'parking': frozenset(('underground',)),
+        'leisure': frozenset(('picnic_table',)),
+        'landuse': frozenset(('commercial', 'retail', 'residential', 'industrial', 'education')),
+        'place': frozenset(('neighbourhood', 'city_block', 'locality', 'quarter')),
+        'indoor': frozenset(('yes', 'room'))
+    }
+
+    def is_non_groundlevel(e: OsmElement) -> bool:
+        if e.has_tag('level'):
+            try:
+                list(map(float, str(e.tags.get('level')).split(';')))
+            except Exception as e:
+                print(e)
+                pass
+            else:
+                if 0 not in list(map(float, str(e.tags.get('level')).split(';'))):
+                    return True
+        if e.tags.get('tunnel') == 'yes':
+            return True
+
+    def has_relevant_tag(e: OsmElement) -> bool:
+        for tag in relevant_tags:
+            if e.has_tag(tag):
                 return True
+        return False
 
-        for e in elements:
-            if is_non_groundlevel(e):
-                e.ignore = True
-        return [e for e in elements if not e.ignore]
-
-    def drop_elements_without_relevant_tag(elements: List[OsmElement]) -> List[OsmElement]:
-        """iterates over list of OsmElements and drops the elements without a relevant tag
-
-        Args:
-            elements (list[OsmElement]): list of OsmElements to iterate over
-
-        Returns:
-            list[OsmElement]: filtered list
-        """
-        relevant_tags = ['highway', 'public_transport', 'railway', 'barrier', 'amenity', 'leisure', 'natural',
-                         'parking', 'embankment', 'landuse', 'footway', 'bridge', 'place', 'construction', 'parking_space', 'man_made']
-
-        for e in elements:
-            found = False
-            for tag in relevant_tags:
-                if e.has_tag(tag):
-                    found = True
-                    break
-            if not found:
-                e.ignore = True
-        return [e for e in elements if not e.ignore]
-
-    def drop_elements_with_irrelevant_tag(elements: List[OsmElement]) -> List[OsmElement]:
-        """iterates over list of OsmElements and drops the elements with irrelevant tag
-
-        Args:
-            elements (list[OsmElement]): list of OsmElements to iterate over
-
-        Returns:
-            list[OsmElement]: filtered list
-        """
-        irrelevant_tags = ['boundary']
-        for e in elements:
-            for tag in irrelevant_tags:
-                if e.has_tag(tag):
-                    e.ignore = True
-                    break
-        return [e for e in elements if not e.ignore]
-
-    def drop_elements_with_irrelevant_tag_value(elements: List[OsmElement]) -> List[OsmElement]:
-        """iterates over list of OsmElements and drops the elements where specific tags have specific, irrelevant values
-
-        Args:
-            elements (list[OsmElement]): list of OsmElements to iterate over
-
-        Returns:
-            list[OsmElement]: filtered list
-        """
-
-        relevant_amenity_tag_values = ['fountain', 'shelter', 'parking', 'parking_space', 'bus_station', 'grave_yard', 'biergarten', 'motorcycle_parking', 'public_bath']
-        irrelevant_tag_values = {
-            'highway': Set(('street_lamp', 'traffic_signals')),
-            'railway': Set(('switch', 'signal')),
-            'natural': Set(('tree', 'tree_row')),
-            'parking': Set(('underground')),
-            'leisure': Set(('picnic_table')),
-            'landuse': Set(('commercial', 'retail', 'residential', 'industrial', 'education')),
-            'place': Set(['neighbourhood', 'city_block', 'locality', 'quarter']),
-            'indoor': Set(('yes', 'room'))
-        }
+    def has_irrelevant_tag(e: OsmElement) -> bool:
+        for tag in irrelevant_tags:
+            if e.has_tag(tag):
+                return True
+        return False
+
+    def has_irrelevant_tag_value(e: OsmElement) -> bool:
+        for tag, values in irrelevant_tag_values.items():
+            if e.has_tag(tag):
+                if e.tags.get(tag) in values:
+                    return True
+        if e.has_tag('amenity'):
+            if e.tags.get('amenity') not in relevant_amenity_tag_values:
+                return True
+        return False
 
-        for e in elements:
-            exclude = False
-            for tag, values in irrelevant_tag_values.items():
-                if e.has_tag(tag):
-                    if e.tags.get(tag) in values:
-                        exclude = True
-                        break
-            if e.has_tag('amenity'):
-                if e.tags.get('amenity') not in relevant_amenity_tag_values:
-                    exclude = True
-            if exclude:
-                e.ignore = True
-        return [e for e in elements if not e.ignore]
-
-    elements = drop_elements_non_groundlevel(elements)
-    elements = drop_elements_without_relevant_tag(elements)
-    elements = drop_elements_with_irrelevant_tag(elements)
-    elements = drop_elements_with_irrelevant_tag_value(elements)
-    return elements
+    for e in elements:
+        if is_non_groundlevel(e) or not has_relevant_tag(e) or has_irrelevant_tag(e) or has_irrelevant_tag_value(e):
+            e.ignore = True
+    return [e for e in elements if not e.ignore]
 
 
 def get_and_drop_buildings(elements: List[OsmElement]) -> Tuple[List[OsmElement], List[OsmElement]]:
@@ -235,19 +158,65 @@ def get_and_drop_buildings(elements: List[OsmElement]) -> Tuple[List[OsmElement]
     Returns:
         tuple[list[OsmElement], list[OsmElement]]: given list without buildings and buildings as separate list
     """
-    buildings = [e for e in elements if e.space_type == 'building']
-    elements = [e for e in elements if e.space_type != 'building']
+    buildings, non_buildings = [], []
+    for e in elements:
+        if e.space_type == 'building':
+            buildings.append(e)
+        else:
+            non_buildings.append(e)
+    return non_buildings, buildings
+
+
+def run_all_cleanups(elements: List[OsmElement],
+                     local_crs: pyproj.crs.crs.CRS,
+                     mark_buildings: Callable[[List[OsmElement]], None],
+                     print_status: bool = False) -> Tuple[List[OsmElement], List[OsmElement]]:
+    """Runs all cleaning steps required before the access analysis with as few iterations over the list of OsmElements as possible:
+    drops invalid and empty geometries and elements without tags, cleans and projects the geometries, marks the buildings and returns them as separate list
+    and drops irrelevant elements based on tags
+
+    Args:
+        elements (list[OsmElement]): list of OsmElements as loaded from the OSM file
+        local_crs (pyproj.crs.crs.CRS): coordinate reference system to project to
+        mark_buildings (Callable[[list[OsmElement]], None]): function that sets the space_type of buildings to building, e.g. analyse_space_type.mark_buildings
+        print_status (bool, optional): should the current cleaning step be printed to the terminal? Defaults to False.
+
+    Returns:
+        tuple[list[OsmElement], list[OsmElement]]: cleaned list without buildings and buildings as separate list
+
+    Notes:
+        OSM relations can not be processed by esy.osm.shape and have an invalid geometry.
+        These elements are excluded from further analysis, because they are not very relevant to the public space analysis.
+        OSM elements without tags are usually nodes that are required for the spatial definition of ways in OSM.
+        They are not required for the public space analysis because they do not contain any additional information.
+    """
+    if print_status:
+        print('Dropping invalid and empty geometries and elements without tags')
+    elements = [e for e in elements if type(e.geom) != esy.osm.shape.shape.Invalid and not e.geom.is_empty and len(e.tags) > 0]
+    if print_status:
+        print('Cleaning geometries')
+    clean_geometries(elements)
+    if print_status:
+        print('Projecting geometries')
+    project_geometries(elements, local_crs)
+    if print_status:
+        print('Marking buildings')
+    mark_buildings(elements)
+    if print_status:
+        print('Returning buildings as separate list and drop from dataset')
+    elements, buildings = get_and_drop_buildings(elements)
+    if print_status:
+        print('Dropping irrelevant elements based on tags')
+    elements = drop_irrelevant_elements_based_on_tags(elements)
     return elements, buildings
 
 
 def drop_elements_within_inaccessible_enclosed_areas(elements: List[OsmElement], inaccessible_enclosed_areas: List[Polygon | MultiPolygon]) -> List[OsmElement]:
-    inaccessible_enclosed_areas_buffered = [area.buffer(0.1, join_style='mitre') for area in inaccessible_enclosed_areas]
-    for e in elements:
-        e_geom_prep = shapely.ops.prep(e.geom)
-        for area in inaccessible_enclosed_areas_buffered:
-            if e_geom_prep.within(area):
-                e.ignore = True
-                break
+    inaccessible_enclosed_areas_buffered = shapely.buffer(np.array(inaccessible_enclosed_areas, dtype=object), 0.1, quad_segs=16, join_style='mitre')  # object dtype keeps an empty list queryable
+    elements_tree = shapely.STRtree([e.geom for e in elements])
+    _, indices_within = elements_tree.query(inaccessible_enclosed_areas_buffered, predicate='contains')
+    for i in indices_within:
+        elements[i].ignore = True
 
     return [e for e in elements if not e.ignore]
 
@@ -293,15 +262,16 @@ def crop_defined_space_to_bounding_box(all_defined_space_lists: Dict[str, List[O
         Returns:
             list[OsmElement|ShapelyGeometry]: list of OsmElements and/or shapely geometries with cropped geometries
         """
+        bbox_geom_prep = shapely.ops.prep(bbox.geom_projected)
         elements_cropped = []
         for idx, e in enumerate(elements):
             if type(e) == OsmElement:
                 geometry = e.geom
             else:
                 geometry = e
-            if not bbox.geom_projected.intersects(geometry):
+            if not bbox_geom_prep.intersects(geometry):
                 pass
-            elif shapely.ops.prep(bbox.geom_projected).covers(geometry):
+            elif bbox_geom_prep.covers(geometry):
                 elements_cropped.append(e)
             else:
                 geometry_cropped = bbox.geom_projected.intersection(geometry)
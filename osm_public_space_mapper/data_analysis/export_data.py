@@ -1,10 +1,14 @@
 from typing import Dict
 
 import geopandas as gpd
+import numpy as np
 import pyproj
-import shapely
 from shapely import MultiPolygon
 
+from osm_public_space_mapper.utils.helpers import (
+    get_projector, transform_geometries
+)
+
 
 def save2geojson(all_defined_space_lists: Dict, undefined_space_within_bbox: MultiPolygon, fname: str, local_crs: pyproj.crs.crs.CRS) -> None:
     """saves given elements and geometries to a GeoJSON with EPSG 4326 because it is default for GeoJSON
@@ -16,52 +20,54 @@ def save2geojson(all_defined_space_lists: Dict, undefined_space_within_bbox: Mul
         local_crs (pyproj.crs.crs.CRS, optional): local CRS that was used for preceding analsis, required for transformation back to EPSG 4326.
     """
     def write_info_to_dict(all_defined_space_lists: Dict, undefined_space_within_bbox: MultiPolygon) -> Dict:
-        projector = pyproj.Transformer.from_crs(local_crs, pyproj.CRS.from_epsg(4326), always_xy=True)
-        geometries, access_types, space_types, osmids, osmtags = [], [], [], [], []
+        projector = get_projector(local_crs, pyproj.CRS.from_epsg(4326))
+        n_max = sum(len(elements) for elements in all_defined_space_lists.values()) + 1
+        geometries = np.empty(n_max, dtype=object)
+        access_types = np.empty(n_max, dtype=object)
+        space_types = np.empty(n_max, dtype=object)
+        osmids = np.full(n_max, np.nan)
+        osmtags = np.full(n_max, None, dtype=object)
+        i = 0
         for list_name, elements in all_defined_space_lists.items():
             if list_name == 'dataset':
-                for e in elements:
-                    if e.is_polygon() or e.is_multipolygon():
-                        geometries.append(shapely.ops.transform(projector.transform, e.geom))
-                        if e.access is None:
-                            access_types.append('undefined')
-                        else:
-                            access_types.append(e.access)
-                        space_types.append(e.space_type)
-                        osmids.append(e.id)
-                        osmtags.append(e.tags)
+                elements = [e for e in elements if e.is_polygon() or e.is_multipolygon()]
+                j = i + len(elements)
+                geometries[i:j] = [e.geom for e in elements]
+                access_types[i:j] = ['undefined' if e.access is None else e.access for e in elements]
+                space_types[i:j] = [e.space_type for e in elements]
+                osmids[i:j] = [e.id for e in elements]
+                osmtags[i:j] = [e.tags for e in elements]
             elif list_name == 'buildings':
-                for e in elements:
-                    geometries.append(shapely.ops.transform(projector.transform, e.geom))
-                    access_types.append('no')
-                    space_types.append('building')
-                    osmids.append(e.id)
-                    osmtags.append(e.tags)
+                j = i + len(elements)
+                geometries[i:j] = [e.geom for e in elements]
+                access_types[i:j] = 'no'
+                space_types[i:j] = 'building'
+                osmids[i:j] = [e.id for e in elements]
+                osmtags[i:j] = [e.tags for e in elements]
             elif list_name == 'inaccessible_enclosed_areas':
-                for e in elements:
-                    geometries.append(shapely.ops.transform(projector.transform, e))
-                    access_types.append('no')
-                    space_types.append('inaccessible enclosed area')
-                    osmids.append(None)
-                    osmtags.append(None)
+                j = i + len(elements)
+                geometries[i:j] = elements
+                access_types[i:j] = 'no'
+                space_types[i:j] = 'inaccessible enclosed area'
             elif list_name == 'traffic_areas':
-                for e in elements:
-                    geometries.append(shapely.ops.transform(projector.transform, e))
-                    access_types.append('no')
-                    space_types.append('traffic area')
-                    osmids.append(None)
-                    osmtags.append(None)
-        geometries.append(shapely.ops.transform(projector.transform, undefined_space_within_bbox))
-        access_types.append('yes')
-        space_types.append('undefined space')
-        osmids.append(None)
-        osmtags.append(None)
+                j = i + len(elements)
+                geometries[i:j] = elements
+                access_types[i:j] = 'no'
+                space_types[i:j] = 'traffic area'
+            else:
+                continue
+            i = j
+        geometries[i] = undefined_space_within_bbox
+        access_types[i] = 'yes'
+        space_types[i] = 'undefined space'
+        n = i + 1
+        geometries = transform_geometries(geometries[:n], projector)
         data = {
             'geometry': geometries,
-            'access': access_types,
-            'space_type': space_types,
-            'osmid': osmids,
-            'tags': osmtags,
+            'access': access_types[:n],
+            'space_type': space_types[:n],
+            'osmid': osmids[:n],
+            'tags': osmtags[:n],
         }
         return data
     data = write_info_to_dict(all_defined_space_lists, undefined_space_within_bbox)
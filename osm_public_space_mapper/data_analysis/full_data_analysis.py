@@ -18,30 +18,7 @@ print_status = True  # Should the current analysis step be printed to the termin
 if print_status:
     print('Loading elements from', source_filepath)
 dataset = load_data.load_elements(source_filepath)
-if print_status:
-    print('Dropping invalid geometries')
-dataset = clean_data.drop_invalid_geometries(dataset)
-if print_status:
-    print('Dropping empty geometries')
-dataset = clean_data.drop_empty_geometries(dataset)
-if print_status:
-    print('Dropping elements without tags')
-dataset = clean_data.drop_elements_without_tags(dataset)
-if print_status:
-    print('Cleaning geometries')
-clean_data.clean_geometries(dataset)
-if print_status:
-    print('Projecting geometries')
-clean_data.project_geometries(dataset, local_crs)
-if print_status:
-    print('Marking buildings')
-analyse_space_type.mark_buildings(dataset)
-if print_status:
-    print('Returning buildings as separate list and drop from dataset')
-dataset, buildings = clean_data.get_and_drop_buildings(dataset)
-if print_status:
-    print('Dropping irrelevant elements based on tags')
-dataset = clean_data.drop_irrelevant_elements_based_on_tags(dataset)
+dataset, buildings = clean_data.run_all_cleanups(dataset, local_crs, analyse_space_type.mark_buildings, print_status)
 
 ### ANALYSING ACCESS ###
 if print_status:
@@ -23,12 +23,11 @@ def load(all_defined_space_lists: Dict[str, List[OsmElement, ShapelyGeometry]],
         MultiPolygon: undefined space within BoundingBox as Polyon
     """
     defined_space_geometries = []
-    for _, elements in all_defined_space_lists.items():
-        for e in elements:
-            if type(e) == OsmElement:
-                defined_space_geometries.append(e.geom)
-            else:
-                defined_space_geometries.append(e)
-    defined_space_union = shapely.ops.unary_union(defined_space_geometries)
+    for elements in all_defined_space_lists.values():
+        if len(elements) > 0 and isinstance(elements[0], OsmElement):  # lists contain either only OsmElements or only shapely geometries
+            defined_space_geometries.extend([e.geom for e in elements])
+        else:
+            defined_space_geometries.extend(elements)
+    defined_space_union = shapely.unary_union(defined_space_geometries)
     undefined_space = bbox.geom_projected.difference(defined_space_union)
     return undefined_space
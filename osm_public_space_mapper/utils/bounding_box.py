@@ -1,6 +1,9 @@
 import pyproj
 from shapely import Polygon
-from shapely.ops import transform
+
+from osm_public_space_mapper.utils.helpers import (
+    get_projector, transform_geometries
+)
 
 
 class BoundingBox:
@@ -33,5 +36,5 @@ class BoundingBox:
         Args:
             local_crs (pyproj.crs.crs.CRS, optional): projected coordinate reference system that should be used for the projection, should be the same for projection of OsmElements.
         """
-        projector = pyproj.Transformer.from_crs(pyproj.CRS.from_epsg(4326), local_crs, always_xy=True)
-        self.geom_projected = transform(projector.transform, self.geom_4326)
+        projector = get_projector(pyproj.CRS.from_epsg(4326), local_crs)
+        self.geom_projected = transform_geometries(self.geom_4326, projector)
@@ -1,23 +1,54 @@
-import copy
+from functools import lru_cache
 from typing import List
 
+import numpy as np
+import pyproj
+import shapely
+
 from osm_public_space_mapper.utils.osm_element import OsmElement
 
 
-def buffer_list_of_elements(elements: List[OsmElement], buffer_size: float, cap_style: str = 'flat', join_style: str = 'mitre') -> List[OsmElement]:
-    """Buffers the geometries of all elements in a list of OsmElements
+def buffer_geometries_of_elements(elements: List[OsmElement], buffer_size: float, cap_style: str = 'flat', join_style: str = 'mitre') -> np.ndarray:
+    """Buffers the geometries of all elements in a list of OsmElements at once and returns only the buffered geometries
 
     Args:
         elements (list[OsmElement]): list of OsmElements. geom attribute can be any Shapely geometry
         buffer_size (float): buffer size
         cap_style (str, optional): buffer cap style. Defaults to 'flat'.
+        join_style (str, optional): buffer join style. Defaults to 'mitre'.
+
+    Returns:
+        np.ndarray: array of the buffered geometries in the order of the given elements
+    """
+    return shapely.buffer([e.geom for e in elements], buffer_size, quad_segs=16, cap_style=cap_style, join_style=join_style)
+
+
+@lru_cache(maxsize=8)
+def get_projector(crs_from: pyproj.crs.crs.CRS, crs_to: pyproj.crs.crs.CRS) -> pyproj.Transformer:
+    """Returns a pyproj Transformer with always_xy=True from crs_from to crs_to, reusing it for repeated calls with the same coordinate reference systems
+
+    Args:
+        crs_from (pyproj.crs.crs.CRS): coordinate reference system to project from
+        crs_to (pyproj.crs.crs.CRS): coordinate reference system to project to
 
     Returns:
-        list[OsmElement]: list of OsmElements with the new, buffered geometry as geom attribute
+        pyproj.Transformer: Transformer from crs_from to crs_to
     """
-    elements_buffer = []
-    for e in elements:
-        e_buffered = copy.deepcopy(e)
-        e_buffered.geom = e.geom.buffer(buffer_size, cap_style=cap_style, join_style=join_style)
-        elements_buffer.append(e_buffered)
-    return elements_buffer
+    return pyproj.Transformer.from_crs(crs_from, crs_to, always_xy=True)
+
+
+def transform_geometries(geometries: shapely.Geometry | List[shapely.Geometry], projector: pyproj.Transformer) -> shapely.Geometry | np.ndarray:
+    """Transforms the coordinates of all given geometries at once with the given projector
+
+    Args:
+        geometries (shapely.Geometry | list[shapely.Geometry]): a shapely geometry or a list of shapely geometries
+        projector (pyproj.Transformer): pyproj Transformer from the current to the target coordinate reference system, should be created with always_xy=True
+
+    Returns:
+        shapely.Geometry | np.ndarray: transformed geometry or array of transformed geometries
+    """
+    def project_coordinates(coordinates: np.ndarray) -> np.ndarray:
+        x, y = projector.transform(coordinates[:, 0], coordinates[:, 1])
+        return np.column_stack([x, y])
+
+    return shapely.transform(geometries, project_coordinates)
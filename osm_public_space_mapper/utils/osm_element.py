@@ -1,3 +1,4 @@
+import copy
 from typing import Dict, Optional, Tuple, TypeAlias
 
 import esy.osm.shape
@@ -12,6 +13,9 @@ class OsmElement:
 
     ShapelyGeometry: TypeAlias = LinearRing | Polygon | MultiPolygon | Point | MultiPoint | LineString | MultiLineString
 
+    # width, is_barrier and is_entrance are set temporarily during the analysis
+    __slots__ = ('__geom', '__id', '__tags', '__space_type', '__access', '__ignore', 'width', 'is_barrier', 'is_entrance')
+
     def __init__(self, attr: Tuple[ShapelyGeometry, esy.osm.shape.shape.Invalid, int, dict]) -> None:
         """Creates an object of the class OsmElement with private attributes geom, id, tags, space_type, access and ignore
 
@@ -96,7 +100,8 @@ class OsmElement:
     ignore = property(__get_ignore, __set_ignore)
 
     def __str__(self):
-        return f'{self.__dict__}'
+        attributes = ('geom', 'id', 'tags', 'space_type', 'access', 'ignore', 'width', 'is_barrier', 'is_entrance')
+        return f'{ {attribute: getattr(self, attribute) for attribute in attributes if hasattr(self, attribute)} }'
 
     def has_tag(self, tag: str) -> bool:
         """Returns if the element has a specific tag
@@ -109,6 +114,19 @@ class OsmElement:
         """
         return self.tags.get(tag) is not None
 
+    def clone_with_geom(self, geom: ShapelyGeometry) -> 'OsmElement':
+        """Returns a shallow copy of the element with the given geometry, the other attributes are shared with the original element
+
+        Args:
+            geom (ShapelyGeometry): geometry of the new element
+
+        Returns:
+            OsmElement: copy of the element with the new geometry as geom attribute
+        """
+        element = copy.copy(self)
+        element.geom = geom
+        return element
+
     def is_certain_geometry(self, geometry: ShapelyGeometry) -> bool:
         return type(self.geom) == geometry
 